@@ -1 +1,6 @@
+from dotenv import load_dotenv
+
+# Load the .env file once, before any submodule reads the environment
+load_dotenv()
+
 from . import agent
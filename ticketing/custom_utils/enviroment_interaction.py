@@ -1,10 +1,19 @@
 from string import Template
+from functools import lru_cache
 import os
 
-def load_instruction_from_file(
-    filename: str, default_instruction: str = "Default instruction.", subs:dict = {}
-) -> str:
-    """Reads instruction text from a file relative to this script."""
+PROMPT_FILES = (
+    "root_agent.prompt",
+    "ticket_batch_classifier_agent.prompt",
+    "ticket_search_agent.prompt",
+    "ticket_creation_agent.prompt",
+    "ticket_update_agent.prompt",
+    "ticketing_orchestrator.prompt",
+)
+
+@lru_cache(maxsize=None)
+def _read_instruction_file(filename: str, default_instruction: str) -> str:
+    """Reads (once per process) instruction text from a file relative to this script."""
     instruction = default_instruction
     try:
         # Construct path relative to the current script file (__file__)
@@ -16,6 +25,18 @@ def load_instruction_from_file(
         print(f"WARNING: Instruction file not found: {filepath}. Using default.")
     except Exception as e:
         print(f"ERROR loading instruction file {filepath}: {e}. Using default.")
+    return instruction
+
+def load_instruction_from_file(
+    filename: str, default_instruction: str = "Default instruction.", subs:dict = {}
+) -> str:
+    """Reads instruction text from a file relative to this script."""
+    # `subs` is a dict (unhashable), so only the file read is memoized
+    instruction = _read_instruction_file(filename, default_instruction)
     instruction = Template(instruction)
     instruction = instruction.safe_substitute(subs) # .substitute(subs  )
-    return instruction
\ No newline at end of file
+    return instruction
+
+# Pre-warm the cache so the first agent construction doesn't touch the disk
+for _filename in PROMPT_FILES:
+    load_instruction_from_file(_filename)
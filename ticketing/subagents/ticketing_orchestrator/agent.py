@@ -1,69 +1,102 @@
 """
-Ticketing Orchestrator Sequential Agent
+Ticketing Orchestrator Routing Agent
 """
 
 # ticketing_orchestrator/agent.py
 from google.adk.agents.llm_agent import Agent, LlmAgent
-from google.adk.agents import SequentialAgent
+from google.adk.models import Gemini
+from google.adk.tools.agent_tool import AgentTool
 from ticketing.custom_utils.enviroment_interaction import load_instruction_from_file
-from ticketing.tools import zammad_client
-from dotenv import load_dotenv
+from ticketing.tools import zammad_async
+from ticketing.tools.turn_cache import turn_cache
+from .batch_classifier import (
+  BATCH_RESULT_KEY,
+  BatchTicketClassifierAgent,
+  TicketClassificationBatch,
+  queue_tickets_for_classification,
+)
 import os
 
-load_dotenv()
-
 model_name = os.getenv('LLM_MODEL', 'gemini-2.5-flash')
 
-ticket_classifier_agent = LlmAgent(
-  model=model_name,
+# One model handle for every agent so they share a single genai client and its
+# connection pool instead of each building their own on first use.
+shared_model = Gemini(model=model_name)
+
+ticket_batch_classifier_agent = LlmAgent(
+  model=shared_model,
+  name='ticket_batch_classifier_agent',
+  instruction=load_instruction_from_file("ticket_batch_classifier_agent.prompt"),
+  include_contents='none',
+  output_schema=TicketClassificationBatch,
+  output_key=BATCH_RESULT_KEY,
+)
+
+ticket_classifier_agent = BatchTicketClassifierAgent(
   name='ticket_classifier_agent',
-  instruction=load_instruction_from_file("ticket_classifier_agent.prompt"),
+  description='Classifies the tickets queued for classification in a single batch.',
+  batch_classifier=ticket_batch_classifier_agent,
 )
 
 ticket_search_agent = LlmAgent(
-  model=model_name,
+  model=shared_model,
   name='ticket_search_agent',
+  description='Finds and summarizes existing tickets, their articles and attachments.',
   instruction=load_instruction_from_file("ticket_search_agent.prompt"),
+  before_tool_callback=turn_cache.before_tool,
+  after_tool_callback=turn_cache.after_tool,
   tools=[
     # zammad_client.init_zammad_client,
-    zammad_client.get_all_tickets,
-    zammad_client.get_ticket,
-    zammad_client.get_ticket_details,
-    zammad_client.get_ticket_articles,
-    zammad_client.list_article_attachments,
-    zammad_client.download_attachment,
+    zammad_async.get_all_tickets,
+    zammad_async.get_ticket,
+    zammad_async.get_ticket_details,
+    zammad_async.get_ticket_articles,
+    zammad_async.list_article_attachments,
+    zammad_async.download_attachment,
+    queue_tickets_for_classification,
   ],
 )
 
 ticket_creation_agent = LlmAgent(
-  model=model_name,
+  model=shared_model,
   name='ticket_creation_agent',
+  description="Creates a new ticket from a request giving its title, description and the user's name and contact details.",
   instruction=load_instruction_from_file("ticket_creation_agent.prompt"),
+  before_tool_callback=turn_cache.before_tool,
+  after_tool_callback=turn_cache.after_tool,
   tools=[
     # zammad_client.init_zammad_client,
-    zammad_client.create_ticket,
+    zammad_async.create_ticket,
   ],
 )
 
 ticket_update_agent = LlmAgent(
-  model=model_name,
+  model=shared_model,
   name='ticket_update_agent',
+  description='Changes the state or priority of an existing ticket or adds a message to it, as confirmed with the user in the request.',
   instruction=load_instruction_from_file("ticket_update_agent.prompt"),
+  before_tool_callback=turn_cache.before_tool,
+  after_tool_callback=turn_cache.after_tool,
   tools=[
     # zammad_client.init_zammad_client,
-    zammad_client.set_ticket_state,
-    zammad_client.set_ticket_priority,
-    zammad_client.send_message_to_ticket,
+    zammad_async.set_ticket_state,
+    zammad_async.set_ticket_priority,
+    zammad_async.send_message_to_ticket,
+    zammad_async.refresh_reference_data,
   ],
 )
 
-ticketing_orchestrator = SequentialAgent(
-    name='ticketing_orchestrator',
-    description='This agent orchestrates the workflow for Zammad ticketing requests.',
-    sub_agents=[
-        ticket_classifier_agent,
-        ticket_search_agent,
-        ticket_creation_agent,
-        ticket_update_agent,
-    ],
-)
\ No newline at end of file
+# Sub-agents are exposed as tools so each request only runs the ones it needs
+ticketing_orchestrator = LlmAgent(
+  model=shared_model,
+  name='ticketing_orchestrator',
+  description='This agent orchestrates the workflow for Zammad ticketing requests.',
+  instruction=load_instruction_from_file("ticketing_orchestrator.prompt"),
+  before_agent_callback=turn_cache.start_turn,
+  tools=[
+    AgentTool(agent=ticket_search_agent),
+    AgentTool(agent=ticket_creation_agent),
+    AgentTool(agent=ticket_update_agent),
+    AgentTool(agent=ticket_classifier_agent),
+  ],
+)
@@ -0,0 +1,170 @@
+"""
+Batch Ticket Classifier Agent
+"""
+
+# ticketing_orchestrator/batch_classifier.py
+import asyncio
+import hashlib
+import logging
+from typing import Any, AsyncGenerator, Dict, List
+
+from cachetools import LRUCache
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.events import Event, EventActions
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+from pydantic import BaseModel
+
+from ticketing.tools import zammad_async
+from ticketing.tools.cache import disk_cache
+
+PENDING_TICKETS_KEY = 'pending_tickets'
+CLASSIFICATION_BATCH_KEY = 'classification_batch'
+BATCH_RESULT_KEY = 'classification_batch_result'
+CHECKPOINT_MAXSIZE = 4096
+
+logger = logging.getLogger(__name__)
+
+# Used when no on-disk cache is configured; least recently used entries are evicted
+_CHECKPOINTS: "LRUCache[str, Dict[str, Any]]" = LRUCache(maxsize=CHECKPOINT_MAXSIZE)
+
+
+class TicketClassification(BaseModel):
+  id: int
+  category: str
+  priority: str
+
+
+class TicketClassificationBatch(BaseModel):
+  classifications: List[TicketClassification]
+
+
+def queue_tickets_for_classification(ticket_ids: List[int], tool_context: ToolContext) -> Dict[str, Any]:
+  """Queue tickets so the classifier labels them together in a single model call."""
+  pending = list(tool_context.state.get(PENDING_TICKETS_KEY) or [])
+  pending.extend(tid for tid in ticket_ids if tid not in pending)
+  tool_context.state[PENDING_TICKETS_KEY] = pending
+  return {'queued': len(pending)}
+
+
+def _checkpoint_key(ticket: Dict[str, Any]) -> str:
+  raw = f"{ticket.get('id')}:{ticket.get('updated_at')}"
+  return 'classification:' + hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _load_checkpoint(key: str) -> Any:
+  disk = disk_cache()
+  return disk.get(key) if disk is not None else _CHECKPOINTS.get(key)
+
+
+def _save_checkpoint(key: str, value: Dict[str, Any]) -> None:
+  disk = disk_cache()
+  if disk is not None:
+    disk.set(key, value)
+  else:
+    _CHECKPOINTS[key] = value
+
+
+def _format_batch(tickets: List[Dict[str, Any]]) -> str:
+  lines = []
+  for n, ticket in enumerate(tickets, start=1):
+    lines.append(f"{n}. [id={ticket.get('id')}] {ticket.get('title', '')}")
+  return '\n'.join(lines)
+
+
+def _render_results(results: Dict[Any, Dict[str, Any]]) -> types.Content:
+  # AgentTool validates the answer against the batch classifier's output schema
+  batch = TicketClassificationBatch(
+      classifications=[TicketClassification.model_validate(item) for item in results.values()]
+  )
+  return types.Content(role='model', parts=[types.Part(text=batch.model_dump_json())])
+
+
+class BatchTicketClassifierAgent(BaseAgent):
+  """Classifies every pending ticket with one shared-prefix model call.
+
+  Tickets queued in session state under ``pending_tickets`` are sent to
+  ``batch_classifier`` as a single numbered list instead of one prompt per
+  ticket. Results are checkpointed by ``(ticket_id, updated_at)`` so tickets
+  that have not changed are never classified twice. The final event renders
+  every result, checkpointed or fresh, as a ``TicketClassificationBatch``;
+  with nothing queued that batch is empty.
+  """
+
+  batch_classifier: LlmAgent
+
+  def __init__(self, name: str, batch_classifier: LlmAgent, **kwargs):
+    super().__init__(
+        name=name,
+        batch_classifier=batch_classifier,
+        sub_agents=[batch_classifier],
+        **kwargs,
+    )
+
+  async def _resolve_tickets(self, pending: List[Any]) -> List[Dict[str, Any]]:
+    ids = [p for p in pending if not isinstance(p, dict)]
+    fetched = await asyncio.gather(*[zammad_async.get_ticket(tid) for tid in ids], return_exceptions=True)
+    tickets = [p for p in pending if isinstance(p, dict)]
+    for tid, ticket in zip(ids, fetched):
+      if isinstance(ticket, zammad_async._API_ERRORS):
+        logger.debug("Fetching ticket %s for classification failed: %s", tid, ticket)
+      elif isinstance(ticket, BaseException):
+        raise ticket
+      elif isinstance(ticket, dict):
+        tickets.append(ticket)
+    return tickets
+
+  async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+    pending = ctx.session.state.get(PENDING_TICKETS_KEY) or []
+    if not pending:
+      yield Event(
+          invocation_id=ctx.invocation_id,
+          author=self.name,
+          branch=ctx.branch,
+          content=_render_results({}),
+      )
+      return
+
+    tickets = await self._resolve_tickets(pending)
+    results: Dict[Any, Dict[str, Any]] = {}
+    todo = []
+    for ticket in tickets:
+      hit = _load_checkpoint(_checkpoint_key(ticket))
+      if hit is not None:
+        results[ticket.get('id')] = hit
+      else:
+        todo.append(ticket)
+
+    if todo:
+      yield Event(
+          invocation_id=ctx.invocation_id,
+          author=self.name,
+          branch=ctx.branch,
+          # Clear the previous batch's result so a reply without output can't be
+          # matched against this batch and checkpointed under the new keys
+          actions=EventActions(state_delta={
+              CLASSIFICATION_BATCH_KEY: _format_batch(todo),
+              BATCH_RESULT_KEY: None,
+          }),
+      )
+      async for event in self.batch_classifier.run_async(ctx):
+        yield event
+
+      batch = ctx.session.state.get(BATCH_RESULT_KEY) or {}
+      by_id = {t.get('id'): t for t in todo}
+      for item in batch.get('classifications', []):
+        ticket = by_id.get(item.get('id'))
+        if ticket is None:
+          continue
+        _save_checkpoint(_checkpoint_key(ticket), item)
+        results[item.get('id')] = item
+
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=self.name,
+        branch=ctx.branch,
+        content=_render_results(results),
+        actions=EventActions(state_delta={PENDING_TICKETS_KEY: []}),
+    )
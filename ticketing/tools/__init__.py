@@ -1,5 +1,8 @@
 """
 This file makes the `tools` directory a Python package.
+
+The synchronous helpers are re-exported here; the agents register the async
+twins from `ticketing.tools.zammad_async` as their tools.
 """
 from .zammad_client import (
     init_zammad_client,
@@ -13,4 +16,5 @@ from .zammad_client import (
     set_ticket_state,
     set_ticket_priority,
     send_message_to_ticket,
+    refresh_reference_data,
 )
\ No newline at end of file
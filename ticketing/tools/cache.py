@@ -0,0 +1,159 @@
+"""Short-lived response cache for read-only Zammad helpers.
+
+Agents tend to re-issue the same reads within a session, so read helpers are
+wrapped with ``@cached(ttl=...)``. Results live in an in-memory
+``cachetools.TTLCache`` and, when ``TICKETING_CACHE_DIR`` is set and
+``diskcache`` is installed, also in an on-disk cache shared between processes.
+
+Write helpers call ``invalidate()``, which bumps a generation counter that is
+part of every key, so stale reads are never served after a change.
+
+Callers get their own deep copy of a cached value, so mutating a returned
+ticket or article list never leaks into later hits.
+"""
+
+import copy
+import functools
+import inspect
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+try:
+	from cachetools import TTLCache
+except Exception as e:
+	raise ImportError("cachetools library is required. Install it in your environment.") from e
+
+try:
+	import diskcache
+except ImportError:
+	diskcache = None
+
+MAXSIZE = 1024
+TICKET_TTL = 30
+
+_LOCK = threading.Lock()
+_MEMORY: Dict[float, TTLCache] = {}
+_GENERATION = 0
+_DISK: Any = None
+_DISK_LOADED = False
+_GENERATION_KEY = "__generation__"
+
+def disk_cache() -> Any:
+	"""Return the shared ``diskcache.Cache`` or ``None`` when disk caching is disabled."""
+	global _DISK, _DISK_LOADED
+	if not _DISK_LOADED:
+		with _LOCK:
+			if not _DISK_LOADED:
+				directory = os.getenv("TICKETING_CACHE_DIR")
+				if directory and diskcache is not None:
+					_DISK = diskcache.Cache(directory)
+				_DISK_LOADED = True
+	return _DISK
+
+def _generation() -> int:
+	disk = disk_cache()
+	if disk is not None:
+		return disk.get(_GENERATION_KEY, 0)
+	return _GENERATION
+
+def invalidate() -> None:
+	"""Discard every cached read by moving to a new cache generation."""
+	global _GENERATION
+	with _LOCK:
+		_GENERATION += 1
+	disk = disk_cache()
+	if disk is not None:
+		disk.incr(_GENERATION_KEY, default=0)
+
+def _make_key(fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Hashable, ...]:
+	return (fn.__module__, fn.__qualname__, _generation(), args, tuple(sorted(kwargs.items())))
+
+def _memory(ttl: float) -> TTLCache:
+	"""Return the in-memory cache shared by every helper cached for `ttl` seconds."""
+	with _LOCK:
+		memory = _MEMORY.get(ttl)
+		if memory is None:
+			memory = _MEMORY[ttl] = TTLCache(maxsize=MAXSIZE, ttl=ttl)
+		return memory
+
+def _lookup(memory: TTLCache, key: Tuple) -> Tuple[bool, Any]:
+	with _LOCK:
+		if key in memory:
+			return True, copy.deepcopy(memory[key])
+	disk = disk_cache()
+	if disk is not None:
+		marker = object()
+		value = disk.get(key, default=marker)
+		if value is not marker:
+			# Unpickled fresh from disk, so the caller can own this copy
+			with _LOCK:
+				memory[key] = copy.deepcopy(value)
+			return True, value
+	return False, None
+
+def _store(memory: TTLCache, ttl: float, key: Tuple, value: Any) -> None:
+	with _LOCK:
+		memory[key] = copy.deepcopy(value)
+	disk = disk_cache()
+	if disk is not None:
+		disk.set(key, value, expire=ttl)
+
+def cached(ttl: float) -> Callable[[Callable], Callable]:
+	"""Cache a function's result for `ttl` seconds, keyed on its name and arguments.
+
+	Works for both plain functions and coroutine functions. Arguments must be
+	hashable; calls with unhashable arguments bypass the cache.
+	"""
+	def decorator(fn: Callable) -> Callable:
+		memory = _memory(ttl)
+
+		if inspect.iscoroutinefunction(fn):
+			@functools.wraps(fn)
+			async def async_wrapper(*args, **kwargs):
+				try:
+					key = _make_key(fn, args, kwargs)
+					hit, value = _lookup(memory, key)
+				except TypeError:
+					return await fn(*args, **kwargs)
+				if hit:
+					return value
+				value = await fn(*args, **kwargs)
+				_store(memory, ttl, key, value)
+				return value
+			return async_wrapper
+
+		@functools.wraps(fn)
+		def wrapper(*args, **kwargs):
+			try:
+				key = _make_key(fn, args, kwargs)
+				hit, value = _lookup(memory, key)
+			except TypeError:
+				return fn(*args, **kwargs)
+			if hit:
+				return value
+			value = fn(*args, **kwargs)
+			_store(memory, ttl, key, value)
+			return value
+		return wrapper
+
+	return decorator
+
+def invalidates(fn: Callable) -> Callable:
+	"""Mark a write helper: cached reads are invalidated once it returns."""
+	if inspect.iscoroutinefunction(fn):
+		@functools.wraps(fn)
+		async def async_wrapper(*args, **kwargs):
+			try:
+				return await fn(*args, **kwargs)
+			finally:
+				invalidate()
+		return async_wrapper
+
+	@functools.wraps(fn)
+	def wrapper(*args, **kwargs):
+		try:
+			return fn(*args, **kwargs)
+		finally:
+			invalidate()
+	return wrapper
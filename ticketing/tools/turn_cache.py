@@ -0,0 +1,103 @@
+"""Per-turn deduplication of identical Zammad tool calls.
+
+Agents often issue the same read (e.g. ``get_ticket(42)``) more than once in a
+single turn. ``TurnCache`` hooks into ADK's agent and tool callbacks so the
+first result is reused for the rest of the turn without hitting Zammad again:
+
+- ``start_turn`` (a ``before_agent_callback``) stores a fresh turn id in the
+  session state; ``AgentTool`` copies that state into sub-agent sessions, so
+  every agent taking part in the turn shares the same id.
+- ``before_tool`` returns the memoized response of a repeated read call.
+- ``after_tool`` records read responses and, for writes, drops the cached
+  reads of the ticket that was changed.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+TURN_ID_KEY = "_turn_id"
+MAX_TURNS = 64
+
+READ_TOOLS = frozenset({
+	"get_all_tickets",
+	"get_ticket",
+	"get_ticket_details",
+	"get_ticket_articles",
+	"list_article_attachments",
+})
+WRITE_TOOLS = frozenset({
+	"create_ticket",
+	"set_ticket_state",
+	"set_ticket_priority",
+	"send_message_to_ticket",
+})
+
+class TurnCache:
+	"""Memoizes read tool responses per agent turn, keyed on ``(tool_name, args)``."""
+
+	def __init__(self, max_turns: int = MAX_TURNS) -> None:
+		self._max_turns = max_turns
+		self._turns: "OrderedDict[str, Dict[Tuple[Hashable, ...], Dict[str, Any]]]" = OrderedDict()
+		self._lock = threading.Lock()
+
+	def _entries(self, state: Any) -> Optional[Dict[Tuple[Hashable, ...], Dict[str, Any]]]:
+		turn_id = state.get(TURN_ID_KEY)
+		if turn_id is None:
+			return None
+		with self._lock:
+			entries = self._turns.get(turn_id)
+			if entries is None:
+				entries = self._turns[turn_id] = {}
+				while len(self._turns) > self._max_turns:
+					self._turns.popitem(last=False)
+			return entries
+
+	@staticmethod
+	def _key(tool_name: str, args: Dict[str, Any]) -> Optional[Tuple[Hashable, ...]]:
+		key = (tool_name, tuple(sorted(args.items())))
+		try:
+			hash(key)
+		except TypeError:
+			return None
+		return key
+
+	def start_turn(self, callback_context: Any) -> None:
+		"""``before_agent_callback``: begin a new turn with an empty cache."""
+		callback_context.state[TURN_ID_KEY] = uuid.uuid4().hex
+		return None
+
+	def before_tool(self, tool: Any, args: Dict[str, Any], tool_context: Any) -> Optional[Dict[str, Any]]:
+		"""``before_tool_callback``: short-circuit a read already made this turn."""
+		if tool.name not in READ_TOOLS:
+			return None
+		entries = self._entries(tool_context.state)
+		key = self._key(tool.name, args)
+		if entries is None or key is None:
+			return None
+		with self._lock:
+			return entries.get(key)
+
+	def after_tool(self, tool: Any, args: Dict[str, Any], tool_context: Any, tool_response: Any) -> None:
+		"""``after_tool_callback``: remember reads, invalidate reads affected by writes."""
+		entries = self._entries(tool_context.state)
+		if entries is None:
+			return None
+
+		if tool.name in READ_TOOLS:
+			key = self._key(tool.name, args)
+			if key is not None:
+				response = tool_response if isinstance(tool_response, dict) else {"result": tool_response}
+				with self._lock:
+					entries[key] = response
+		elif tool.name in WRITE_TOOLS:
+			ticket_id = args.get("ticket_id")
+			with self._lock:
+				for key in list(entries):
+					name, frozen_args = key
+					if name == "get_all_tickets" or ticket_id is None or dict(frozen_args).get("ticket_id") == ticket_id:
+						del entries[key]
+		return None
+
+turn_cache = TurnCache()
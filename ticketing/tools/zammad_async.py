@@ -0,0 +1,402 @@
+"""Async Zammad helper tools.
+
+Asynchronous counterparts of the helpers in ``zammad_client`` that talk to
+Zammad's REST API directly through one shared ``httpx.AsyncClient``. These are
+the callables registered as ADK tools, so several round-trips issued by an
+agent in the same turn can overlap on pooled keep-alive connections instead of
+blocking the event loop one after another.
+
+The synchronous ``zammad_client`` module is kept alongside rather than turned
+into ``asyncio.run`` shims: it is the package's public API and works through
+whichever ``zammad_py`` wrapper is installed, so it carries fallbacks for
+wrapper variants that this module, speaking the REST API directly, does not
+need. ``run_sync`` is provided for scripts that want these helpers directly.
+"""
+
+import asyncio
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+from .cache import TICKET_TTL, cached, invalidates
+from .zammad_common import CONFIG, DOWNLOAD_CHUNK_SIZE, json_dumps, json_loads, partial_file
+
+try:
+	import httpx
+except Exception as e:
+	raise ImportError("httpx library is required. Install it in your environment.") from e
+
+try:
+	from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+except Exception as e:
+	raise ImportError("tenacity library is required. Install it in your environment.") from e
+
+PER_PAGE = 100
+# Pages requested per concurrent burst when Zammad does not report a total
+PAGE_WINDOW = 4
+MAX_CONCURRENCY = int(os.getenv("ZAMMAD_MAX_CONCURRENCY", "20"))
+
+logger = logging.getLogger(__name__)
+
+# Failures the helpers recover from: transport/HTTP errors and bodies that are
+# not valid JSON (orjson.JSONDecodeError is a ValueError).
+_API_ERRORS = (httpx.HTTPError, ValueError)
+
+_REFERENCE_MAPS: Dict[str, Dict[str, int]] = {}
+
+_ASYNC_CLIENT: Optional["httpx.AsyncClient"] = None
+_ASYNC_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_ZAMMAD_SEM: Optional[asyncio.Semaphore] = None
+
+def _async_client() -> "httpx.AsyncClient":
+	"""Return the shared ``httpx.AsyncClient``, creating it on first use.
+
+	Connections (and the concurrency semaphore) are bound to the event loop
+	that opened them, so both are recreated if the helpers are called from a
+	different running loop; the previous client is closed on its own loop
+	while that loop is still running.
+	"""
+	global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP, _ZAMMAD_SEM
+	loop = asyncio.get_running_loop()
+	if _ASYNC_CLIENT is not None and _ASYNC_CLIENT_LOOP is loop and not _ASYNC_CLIENT.is_closed:
+		return _ASYNC_CLIENT
+
+	if _ASYNC_CLIENT is not None and not _ASYNC_CLIENT.is_closed:
+		old_loop = _ASYNC_CLIENT_LOOP
+		if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+			asyncio.run_coroutine_threadsafe(_ASYNC_CLIENT.aclose(), old_loop)
+		else:
+			logger.debug("Dropping an AsyncClient whose event loop is no longer running")
+
+	_ASYNC_CLIENT = httpx.AsyncClient(
+		base_url=CONFIG.api_url,
+		auth=(CONFIG.username, CONFIG.password),
+		http2=True,
+		limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+		timeout=httpx.Timeout(30.0),
+	)
+	_ASYNC_CLIENT_LOOP = loop
+	_ZAMMAD_SEM = asyncio.Semaphore(MAX_CONCURRENCY)
+	return _ASYNC_CLIENT
+
+async def aclose_async_client() -> None:
+	"""Close the shared ``httpx.AsyncClient`` and its connection pool, if one is open."""
+	global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP, _ZAMMAD_SEM
+	client, _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP, _ZAMMAD_SEM = _ASYNC_CLIENT, None, None, None
+	if client is not None:
+		await client.aclose()
+
+def run_sync(coro: Any) -> Any:
+	"""Run one of the async helpers from synchronous code and return its result.
+
+	``asyncio.run`` uses a fresh event loop per call, so the client opened on
+	that loop is closed before the loop goes away.
+	"""
+	async def _run() -> Any:
+		try:
+			return await coro
+		finally:
+			await aclose_async_client()
+	return asyncio.run(_run())
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+def _is_retryable(exc: BaseException) -> bool:
+	"""Retry throttling, server errors and dropped connections.
+
+	Requests that may already have reached Zammad are only retried for
+	idempotent methods, so a POST never creates a ticket or article twice.
+	"""
+	if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+		return True
+	if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+		return True
+	if isinstance(exc, (httpx.TransportError, httpx.HTTPStatusError)):
+		if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code < 500:
+			return False
+		return exc.request.method in _IDEMPOTENT_METHODS
+	return False
+
+@retry(
+	stop=stop_after_attempt(5),
+	wait=wait_exponential_jitter(initial=0.1, max=5),
+	retry=retry_if_exception(_is_retryable),
+	reraise=True,
+)
+async def _request(method: str, path: str, **kwargs: Any) -> "httpx.Response":
+	"""Send one request to Zammad, bounded by the concurrency semaphore and retried with backoff."""
+	client = _async_client()
+	if "json" in kwargs:
+		kwargs["content"] = json_dumps(kwargs.pop("json"))
+		kwargs["headers"] = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
+	async with _ZAMMAD_SEM:
+		resp = await client.request(method, path, **kwargs)
+	resp.raise_for_status()
+	return resp
+
+async def _get_json(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+	resp = await _request("GET", path, params=params)
+	return json_loads(resp.content)
+
+def _page_items(batch: Any, key: Optional[str] = None) -> List[Any]:
+	if not batch:
+		return []
+	if isinstance(batch, dict) and key is not None and isinstance(batch.get(key), list):
+		return batch[key]
+	return batch if isinstance(batch, list) else [batch]
+
+def _total_count(resp: "httpx.Response", body: Any) -> Optional[int]:
+	"""Return the total item count from the pagination headers or a ``total_count`` body field."""
+	for header in ("X-Pagination-Total", "X-Total-Count"):
+		value = resp.headers.get(header)
+		if value and value.isdigit():
+			return int(value)
+	if isinstance(body, dict) and isinstance(body.get("total_count"), int):
+		return body["total_count"]
+	return None
+
+async def _iter_pages(path: str, per_page: int = PER_PAGE, start: int = 1) -> AsyncIterator[Any]:
+	"""Yield items page by page, requesting the next page only when needed."""
+	page = start
+	while True:
+		batch = await _get_json(path, params={"page": page, "per_page": per_page})
+		if not batch:
+			return
+		if not isinstance(batch, list):
+			yield batch
+			return
+		for item in batch:
+			yield item
+		if len(batch) < per_page:
+			return
+		page += 1
+
+async def _collect_pages_parallel(path: str, per_page: int = PER_PAGE) -> List[Any]:
+	"""Fetch every page of `path`, requesting pages 2..N concurrently.
+
+	The first page is requested with ``with_total_count`` so Zammad can report
+	the total, either in a pagination header or as ``total_count`` in the body;
+	the remaining pages are then fetched in one ``asyncio.gather`` burst over the
+	pooled connections. Without a total, pages are fetched speculatively in
+	windows of ``PAGE_WINDOW`` until a short page marks the end.
+	"""
+	key = path.rsplit("/", 1)[-1]
+	resp = await _request("GET", path, params={"page": 1, "per_page": per_page, "with_total_count": "true"})
+	body = json_loads(resp.content)
+	items = _page_items(body, key)
+	if len(items) < per_page:
+		return items
+
+	async def fetch(page: int) -> List[Any]:
+		return _page_items(await _get_json(path, params={"page": page, "per_page": per_page}), key)
+
+	total = _total_count(resp, body)
+	if total is not None:
+		n_pages = math.ceil(total / per_page)
+		for batch in await asyncio.gather(*[fetch(p) for p in range(2, n_pages + 1)]):
+			items.extend(batch)
+		return items
+
+	start = 2
+	while True:
+		batches = await asyncio.gather(*[fetch(p) for p in range(start, start + PAGE_WINDOW)])
+		for batch in batches:
+			items.extend(batch)
+			if len(batch) < per_page:
+				return items
+		start += PAGE_WINDOW
+
+async def _reference_map(path: str) -> Dict[str, int]:
+	"""Return ``{name.lower(): id}`` for the reference list at `path`, built once per process."""
+	mapping = _REFERENCE_MAPS.get(path)
+	if mapping is None:
+		mapping = {str(item.get("name", "")).lower(): item.get("id") async for item in _iter_pages(path)}
+		_REFERENCE_MAPS[path] = mapping
+	return mapping
+
+async def _priority_map() -> Dict[str, int]:
+	return await _reference_map("ticket_priorities")
+
+async def _state_map() -> Dict[str, int]:
+	return await _reference_map("ticket_states")
+
+async def refresh_reference_data() -> Dict[str, int]:
+	"""Reload the cached ticket priority and state names, e.g. after an admin edits them.
+
+	Returns the number of priorities and states now known.
+	"""
+	_REFERENCE_MAPS.clear()
+	return {"priorities": len(await _priority_map()), "states": len(await _state_map())}
+
+@cached(ttl=TICKET_TTL)
+async def get_all_tickets() -> List[Dict[str, Any]]:
+	"""Fetch all tickets.
+
+	Returns a list of ticket dicts.
+	"""
+	return await _collect_pages_parallel("tickets")
+
+@cached(ttl=TICKET_TTL)
+async def get_ticket(ticket_id: int) -> Dict[str, Any]:
+	"""Fetch a single ticket by `ticket_id`."""
+	return await _get_json(f"tickets/{ticket_id}")
+
+@cached(ttl=TICKET_TTL)
+async def get_ticket_articles(ticket_id: int) -> List[Dict[str, Any]]:
+	"""Fetch the articles that belong to `ticket_id`."""
+	return await _get_json(f"ticket_articles/by_ticket/{ticket_id}") or []
+
+@cached(ttl=TICKET_TTL)
+async def get_all_articles() -> List[Dict[str, Any]]:
+	"""Fetch all ticket articles (paginated) and return as a list."""
+	return await _collect_pages_parallel("ticket_articles")
+
+@invalidates
+async def create_ticket(ticket_data: Dict[str, Any]) -> Dict[str, Any]:
+	"""Create a new ticket in Zammad."""
+	resp = await _request("POST", "tickets", json=ticket_data)
+	return json_loads(resp.content)
+
+async def get_ticket_details(ticket_id: int, include_attachments: bool = True) -> Dict[str, Any]:
+	"""Return a consolidated view for a ticket: ticket data, articles and attachments metadata."""
+	try:
+		ticket = await get_ticket(ticket_id)
+	except _API_ERRORS as e:
+		logger.debug("Fetching ticket %s failed: %s", ticket_id, e)
+		ticket = {"id": ticket_id, "error": str(e)}
+
+	try:
+		articles = await get_ticket_articles(ticket_id)
+	except _API_ERRORS as e:
+		logger.debug("Fetching articles for ticket %s failed: %s", ticket_id, e)
+		articles = []
+
+	attachments_map = {}
+	if include_attachments and articles:
+		# Fetch every article's attachments concurrently; API failures map to []
+		ids = [a.get("id") for a in articles]
+		results = await asyncio.gather(
+			*[list_article_attachments(ticket_id, aid) for aid in ids],
+			return_exceptions=True,
+		)
+		for aid, atts in zip(ids, results):
+			if isinstance(atts, _API_ERRORS):
+				logger.debug("Listing attachments of article %s failed: %s", aid, atts)
+				atts = []
+			elif isinstance(atts, BaseException):
+				raise atts
+			attachments_map[aid] = atts
+
+	return {"ticket": ticket, "articles": articles, "attachments": attachments_map}
+
+async def _update_ticket(ticket_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+	resp = await _request("PUT", f"tickets/{ticket_id}", json=params)
+	return json_loads(resp.content)
+
+@invalidates
+async def set_ticket_state(ticket_id: int, state: Optional[str] = None, state_id: Optional[int] = None) -> Dict[str, Any]:
+	"""Update the ticket's state. Accepts either a state name or a state_id."""
+	params = {}
+	if state_id is not None:
+		params["state_id"] = state_id
+	if state is not None:
+		# some APIs accept `state` or `state_id`; we'll include both where possible
+		params["state"] = state
+		if state_id is None:
+			try:
+				resolved = (await _state_map()).get(state.lower())
+			except _API_ERRORS as e:
+				logger.debug("Resolving state %r failed: %s", state, e)
+				resolved = None
+			if resolved is not None:
+				params["state_id"] = resolved
+
+	if not params:
+		raise ValueError("Either state or state_id must be provided")
+
+	return await _update_ticket(ticket_id, params)
+
+@invalidates
+async def set_ticket_priority(ticket_id: int, priority_id: Optional[int] = None, priority_name: Optional[str] = None) -> Dict[str, Any]:
+	"""Set or update a ticket's priority by id or name."""
+	if priority_id is None and priority_name is None:
+		raise ValueError("Either priority_id or priority_name must be provided")
+
+	# Resolve name to id if needed
+	if priority_id is None and priority_name is not None:
+		try:
+			priority_id = (await _priority_map()).get(str(priority_name).lower())
+		except _API_ERRORS as e:
+			logger.debug("Resolving priority %r failed: %s", priority_name, e)
+			priority_id = None
+
+	if priority_id is None:
+		raise ValueError("Could not resolve priority id; provide a valid priority_id or priority_name")
+
+	return await _update_ticket(ticket_id, {"priority_id": priority_id})
+
+@cached(ttl=TICKET_TTL)
+async def list_article_attachments(ticket_id: int, article_id: int) -> List[Dict[str, Any]]:
+	"""Return a list of attachment dicts with at least `id` and `filename` when possible."""
+	art = await _get_json(f"ticket_articles/{article_id}")
+	if not isinstance(art, dict):
+		return []
+	for key in ("attachments", "attachment_ids", "attachments_ids"):
+		vals = art.get(key)
+		if isinstance(vals, list) and vals:
+			return [v if isinstance(v, dict) else {"id": v, "filename": f"attachment_{v}"} for v in vals]
+	return []
+
+async def download_attachment(attachment_id: int, ticket_id: int, article_id: int, dest_path: str) -> Path:
+	"""Download an attachment to `dest_path`.
+
+	`dest_path` should be a string (helps with ADK automatic function calling);
+	it will be converted to a `Path` internally.
+	"""
+	dest_path = Path(dest_path)
+	dest_path.parent.mkdir(parents=True, exist_ok=True)
+	client = _async_client()
+	# Streamed bodies can't be replayed, so downloads are throttled but not retried
+	async with _ZAMMAD_SEM:
+		async with client.stream("GET", f"ticket_attachment/{ticket_id}/{article_id}/{attachment_id}") as resp:
+			resp.raise_for_status()
+			with partial_file(dest_path) as f:
+				async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+					f.write(chunk)
+
+	return dest_path
+
+@invalidates
+async def send_message_to_ticket(ticket_id: int,
+						 message: str,
+						 subject: Optional[str] = None,
+						 author_id: Optional[int] = None,
+						 internal: bool = False,
+						 article_type: Optional[str] = None,
+						 additional_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+	"""Add a message (article) to an existing ticket.
+
+	Parameters:
+	- `ticket_id`: ID of the ticket to add the message to.
+	- `message`: The article body/content.
+	- `subject`: Optional subject/title for the article.
+	- `author_id`: Optional id of the user creating the article.
+	- `internal`: If True, the article will be internal (private) where supported.
+	- `article_type`: Optional type/name for the article (e.g. 'note', 'reply').
+	- `additional_params`: Dict of any extra params to pass through to the API.
+
+	Returns the created article (a dict) on success.
+	"""
+	params: Dict[str, Any] = {"ticket_id": ticket_id, "body": message, "internal": internal}
+	if subject is not None:
+		params["subject"] = subject
+	if author_id is not None:
+		params["author_id"] = author_id
+	if article_type is not None:
+		params["type"] = article_type
+	if additional_params:
+		params.update(additional_params)
+
+	resp = await _request("POST", "ticket_articles", json=params)
+	return json_loads(resp.content)
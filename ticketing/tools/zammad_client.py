@@ -6,168 +6,309 @@ This file reimplements the same helpers provided by the project's top-level
 
 It intentionally mirrors the top-level reference implementation and aims to be
 robust against minor differences in Zammad client wrapper implementations.
+The agents use the async REST twins in ``zammad_async`` instead; see that
+module for why both are kept.
 """
 
-import os
-import json
-import base64
+import functools
+import inspect
+import logging
+import re
+import shutil
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dotenv import load_dotenv
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple
+from .cache import TICKET_TTL, cached, invalidates
+from .zammad_common import CONFIG, DOWNLOAD_CHUNK_SIZE, json_loads, partial_file
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-try:
-	from zammad_py import ZammadAPI
-except Exception as e:
-	raise ImportError("zammad_py library is required. Install it in your environment.") from e
+_BASE64_RE = re.compile(r"^[A-Za-z0-9+/=\s]+$")
+
+_ZammadAPI: Any = None
+_CLIENT: Any = None
+_CLIENT_LOCK = threading.Lock()
+_create_article_fn: Optional[Callable[[int, Dict[str, Any]], Any]] = None
+_download_attachment_fn: Optional[Callable[[int, int, int], Any]] = None
+
+@functools.lru_cache(maxsize=1)
+def _api_errors() -> Tuple[type, ...]:
+	"""Return the exceptions the helpers recover from.
+
+	zammad_py raises TypeError/ValueError/NotImplementedError subclasses for
+	calls a wrapper does not support, and requests' ``RequestException``
+	(incl. ``HTTPError``) for failed requests. ``requests`` is imported here on
+	first use so loading the tools stays cheap.
+	"""
+	from requests.exceptions import RequestException
+	return (TypeError, ValueError, NotImplementedError, RequestException)
+
+def _mount_pool(session: Any) -> None:
+	"""Mount a pooled, retrying adapter on the client's ``requests.Session``."""
+	from requests.adapters import HTTPAdapter
+	from urllib3.util.retry import Retry
+
+	retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504))
+	adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+	session.mount("http://", adapter)
+	session.mount("https://", adapter)
+
+def _resolve_endpoints(client: Any) -> None:
+	"""Bind the article-creation and attachment-download calls this wrapper supports.
+
+	Runs once when the shared client is built, so the helpers make a single
+	direct call instead of probing several call patterns on every invocation.
+	"""
+	global _create_article_fn, _download_attachment_fn
+
+	if hasattr(client, "ticket_article"):
+		create = client.ticket_article.create
+		if _call_style(create) == "kw":
+			_create_article_fn = lambda ticket_id, params: create(params=params)
+		else:
+			_create_article_fn = lambda ticket_id, params: create(params)
+	else:
+		# Some wrappers provide creation via the ticket endpoint
+		_create_article_fn = lambda ticket_id, params: _update_ticket(client, ticket_id, {"article": params})
+
+	if hasattr(client, "ticket_article_attachment"):
+		download = client.ticket_article_attachment.download
+		if _accepts(download, "ticket_id"):
+			_download_attachment_fn = lambda attachment_id, ticket_id, article_id: download(id=attachment_id, ticket_id=ticket_id, article_id=article_id)
+		else:
+			_download_attachment_fn = lambda attachment_id, ticket_id, article_id: download(attachment_id, ticket_id, article_id)
+	elif hasattr(client, "attachment"):
+		download = client.attachment.download
+		if _accepts(download, "id"):
+			_download_attachment_fn = lambda attachment_id, ticket_id, article_id: download(id=attachment_id)
+		else:
+			_download_attachment_fn = lambda attachment_id, ticket_id, article_id: download(attachment_id)
+	else:
+		_download_attachment_fn = None
+
+def _get_client() -> Any:
+	"""Return the shared ZammadAPI client, creating it on first use.
+
+	The client (and its underlying ``requests.Session``) is kept for the life of
+	the process so every helper reuses the same keep-alive connection pool.
+	"""
+	global _CLIENT, _ZammadAPI
+	if _CLIENT is not None:
+		return _CLIENT
+	with _CLIENT_LOCK:
+		if _CLIENT is None:
+			if _ZammadAPI is None:
+				# Imported on first use so loading the tools doesn't pull in requests/urllib3
+				try:
+					from zammad_py import ZammadAPI
+				except ImportError as e:
+					raise ImportError("zammad_py library is required. Install it in your environment.") from e
+				_ZammadAPI = ZammadAPI
+			client = _ZammadAPI(url=CONFIG.api_url, username=CONFIG.username, password=CONFIG.password)
+			session = getattr(client, "session", None)
+			if session is not None:
+				_mount_pool(session)
+			_resolve_endpoints(client)
+			_CLIENT = client
+	return _CLIENT
 
 def init_zammad_client() -> Any:
-	"""Create and return a ZammadAPI client object using environment variables.
+	"""Return the shared ZammadAPI client configured from the environment.
 
-	This internal helper is used by the module functions to create a fresh
-	client on each call. It does NOT register the client in the ADK
-	`_CLIENT_REGISTRY` (that registry is used by the ADK-facing
-	`init_zammad_client`).
+	Kept for callers of the original API; it is equivalent to ``_get_client()``.
 	"""
-	url_base = os.getenv("zammad_url")
-	if not url_base:
-		raise EnvironmentError(f"Environment variable `zammad_url` is not set")
-	url = url_base.rstrip("/") + "/api/v1/"
-	username = os.getenv("zammad_username")
-	password = os.getenv("zammad_password")
-	return ZammadAPI(url=url, username=username, password=password)
-
-def _collect_pages(first_page) -> List[Any]:
-	items: List[Any] = []
-	page = first_page
-	if not page:
-		return items
-	try:
-		items.extend(page)
-	except TypeError:
-		# single object
-		items.append(page)
+	return _get_client()
 
-	while hasattr(page, "next_page") and callable(getattr(page, "next_page")):
-		page = page.next_page()
-		if not page:
-			break
+def _iter_pages(first_page) -> Iterator[Any]:
+	"""Yield items page by page, requesting the next page only when needed.
+
+	Callers that need everything wrap this in ``list()``; callers looking for a
+	single match can stop early and skip fetching the remaining pages.
+	"""
+	page = first_page
+	while page:
 		try:
-			items.extend(page)
+			yield from page
 		except TypeError:
-			items.append(page)
+			# single object
+			yield page
+		if not (hasattr(page, "next_page") and callable(getattr(page, "next_page"))):
+			break
+		page = page.next_page()
+
+@functools.lru_cache(maxsize=None)
+def _parameters(func: Callable) -> Tuple[str, ...]:
+	try:
+		params = inspect.signature(func).parameters.values()
+	except (TypeError, ValueError):
+		return ()
+	return tuple("**" if p.kind is p.VAR_KEYWORD else p.name for p in params)
+
+def _accepts(method: Callable, name: str) -> bool:
+	"""Return True if `method` accepts a keyword argument called `name`.
+
+	Signatures are inspected once per underlying function, so bound methods of
+	freshly created resource objects all share the cached answer.
+	"""
+	params = _parameters(getattr(method, "__func__", method))
+	return name in params or "**" in params
 
-	return items
+def _call_style(method: Callable) -> Literal["kw", "pos"]:
+	"""Return ``"kw"`` if `method` takes its payload as a ``params`` keyword, else ``"pos"``."""
+	return "kw" if _accepts(method, "params") else "pos"
 
+def _update_ticket(client: Any, ticket_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+	update = client.ticket.update
+	if _call_style(update) == "kw":
+		return update(id=ticket_id, params=params)
+	# fallback if client expects positional args
+	return update(ticket_id, params)
+
+def _name_id_map(first_page) -> Dict[str, int]:
+	return {str(item.get("name", "")).lower(): item.get("id") for item in _iter_pages(first_page)}
+
+@functools.lru_cache(maxsize=1)
+def _priority_map() -> Dict[str, int]:
+	"""Return ``{name.lower(): id}`` for all ticket priorities, built once per process."""
+	return _name_id_map(_get_client().ticket_priority.all())
+
+@functools.lru_cache(maxsize=1)
+def _state_map() -> Dict[str, int]:
+	"""Return ``{name.lower(): id}`` for all ticket states, built once per process."""
+	return _name_id_map(_get_client().ticket_state.all())
+
+def refresh_reference_data() -> Dict[str, int]:
+	"""Reload the cached ticket priority and state names, e.g. after an admin edits them.
+
+	Returns the number of priorities and states now known.
+	"""
+	_priority_map.cache_clear()
+	_state_map.cache_clear()
+	return {"priorities": len(_priority_map()), "states": len(_state_map())}
+
+@cached(ttl=TICKET_TTL)
 def get_all_tickets() -> List[Dict[str, Any]]:
-	"""Fetch all tickets. A Zammad client is created internally for this call.
+	"""Fetch all tickets. The shared Zammad client is used for this call.
 
 	Returns a list of ticket dicts.
 	"""
-	client = init_zammad_client()
+	client = _get_client()
 	page = client.ticket.all()
-	return _collect_pages(page)
+	return list(_iter_pages(page))
 
+@cached(ttl=TICKET_TTL)
 def get_ticket(ticket_id: int) -> Dict[str, Any]:
-	"""Fetch a single ticket by `ticket_id`. A Zammad client is created internally."""
-	client = init_zammad_client()
+	"""Fetch a single ticket by `ticket_id`. The shared Zammad client is used."""
+	client = _get_client()
 	return client.ticket.find(ticket_id)
 
+@cached(ttl=TICKET_TTL)
 def get_ticket_articles(ticket_id: int) -> List[Dict[str, Any]]:
-	# Some client implementations ignore the ticket_id parameter. Fetch all articles
-	# and filter by `ticket_id` to ensure we only return articles for the requested ticket.
-	client = init_zammad_client()
+	"""Fetch the articles that belong to `ticket_id`.
+
+	Uses the ticket-scoped ``ticket_articles/by_ticket/{id}`` endpoint so only the
+	ticket's own articles are transferred. Scanning every article in the instance
+	and filtering by `ticket_id` is kept only for wrappers that lack a scoped
+	call; HTTP errors (e.g. 404 for an unknown ticket) are raised, not scanned.
+	"""
+	client = _get_client()
 	try:
+		if hasattr(client.ticket, "articles"):
+			articles = client.ticket.articles(ticket_id)
+		else:
+			resp = client.session.get(f"{client.url}ticket_articles/by_ticket/{ticket_id}")
+			resp.raise_for_status()
+			articles = json_loads(resp.content)
+	except (AttributeError, TypeError) as e:
+		logger.debug("No ticket-scoped article call for ticket %s, scanning all articles: %s", ticket_id, e)
 		page = client.ticket_article.all()
-	except TypeError:
-		# Fallback: some clients expect positional args; ignore and fetch all
-		page = client.ticket_article.all()
-
-	all_articles = _collect_pages(page)
-	return [a for a in all_articles if a.get("ticket_id") == ticket_id]
+		return [a for a in _iter_pages(page) if a.get("ticket_id") == ticket_id]
+	return list(_iter_pages(articles))
 
+@cached(ttl=TICKET_TTL)
 def get_all_articles() -> List[Dict[str, Any]]:
 	"""Fetch all ticket articles (paginated) and return as a list."""
-	client = init_zammad_client()
+	client = _get_client()
 	page = client.ticket_article.all()
-	return _collect_pages(page)
+	return list(_iter_pages(page))
 
+@invalidates
 def create_ticket(ticket_data: Dict[str, Any]) -> Dict[str, Any]:
 	"""Create a new ticket in Zammad.
 
-	A Zammad client is created internally for this call.
+	The shared Zammad client is used for this call.
 	"""
-	client = init_zammad_client()
-	try:
-		return client.ticket.create(params=ticket_data)
-	except TypeError:
-		# Some client wrappers accept positional args
-		return client.ticket.create(ticket_data)
+	client = _get_client()
+	create = client.ticket.create
+	if _call_style(create) == "kw":
+		return create(params=ticket_data)
+	# Some client wrappers accept positional args
+	return create(ticket_data)
 
 def get_ticket_details(ticket_id: int, include_attachments: bool = True) -> Dict[str, Any]:
 	"""Return a consolidated view for a ticket: ticket data, articles and attachments metadata.
 
-	A Zammad client is created internally for this call.
+	The shared Zammad client is used for this call.
 	"""
-	client = init_zammad_client()
-	ticket = None
 	try:
-		ticket = get_ticket(ticket_id, )
-	except Exception as e:
+		ticket = get_ticket(ticket_id)
+	except _api_errors() as e:
+		logger.debug("Fetching ticket %s failed: %s", ticket_id, e)
 		ticket = {"id": ticket_id, "error": str(e)}
 
-	# Prefer fetching all articles and filtering to avoid client inconsistencies
 	try:
-		all_articles = get_all_articles()
-		articles = [a for a in all_articles if a.get("ticket_id") == ticket_id]
-	except Exception:
-		# fallback to ticket-scoped call
-		try:
-			articles = get_ticket_articles(ticket_id, )
-		except Exception:
-			articles = []
+		articles = get_ticket_articles(ticket_id)
+	except _api_errors() as e:
+		logger.debug("Fetching articles for ticket %s failed: %s", ticket_id, e)
+		articles = []
 
 	attachments_map = {}
 	if include_attachments:
 		for art in articles:
 			aid = art.get("id")
 			try:
-				atts = list_article_attachments(ticket_id, aid, )
-			except Exception:
+				atts = list_article_attachments(ticket_id, aid)
+			except _api_errors() as e:
+				logger.debug("Listing attachments of article %s failed: %s", aid, e)
 				atts = []
 			attachments_map[aid] = atts
 
 	return {"ticket": ticket, "articles": articles, "attachments": attachments_map}
 
+@invalidates
 def set_ticket_state(ticket_id: int, state: Optional[str] = None, state_id: Optional[int] = None) -> Dict[str, Any]:
 	"""Update the ticket's state. Accepts either a state name or a state_id.
 
-	A Zammad client is created internally for this call.
+	The shared Zammad client is used for this call.
 	"""
-	client = init_zammad_client()
+	client = _get_client()
 	params = {}
 	if state_id is not None:
 		params["state_id"] = state_id
 	if state is not None:
 		# some APIs accept `state` or `state_id`; we'll include both where possible
 		params["state"] = state
+		if state_id is None:
+			try:
+				resolved = _state_map().get(state.lower())
+			except _api_errors() as e:
+				logger.debug("Resolving state %r failed: %s", state, e)
+				resolved = None
+			if resolved is not None:
+				params["state_id"] = resolved
 
 	if not params:
 		raise ValueError("Either state or state_id must be provided")
 
-	try:
-		return client.ticket.update(id=ticket_id, params=params)
-	except TypeError:
-		# fallback if client expects positional args
-		return client.ticket.update(ticket_id, params)
+	return _update_ticket(client, ticket_id, params)
 
+@invalidates
 def set_ticket_priority(ticket_id: int, priority_id: Optional[int] = None, priority_name: Optional[str] = None) -> Dict[str, Any]:
 	"""Set or update a ticket's priority by id or name.
 
-	A Zammad client is created internally for this call.
+	The shared Zammad client is used for this call.
 	"""
-	client = init_zammad_client()
+	client = _get_client()
 
 	if priority_id is None and priority_name is None:
 		raise ValueError("Either priority_id or priority_name must be provided")
@@ -175,63 +316,50 @@ def set_ticket_priority(ticket_id: int, priority_id: Optional[int] = None, prior
 	# Resolve name to id if needed
 	if priority_id is None and priority_name is not None:
 		try:
-			page = client.ticket_priority.all()
-			priorities = _collect_pages(page)
-			for p in priorities:
-				if str(p.get("name", "")).lower() == str(priority_name).lower():
-					priority_id = p.get("id")
-					break
-		except Exception:
+			priority_id = _priority_map().get(str(priority_name).lower())
+		except _api_errors() as e:
+			logger.debug("Resolving priority %r failed: %s", priority_name, e)
 			priority_id = None
 
 	if priority_id is None:
 		raise ValueError("Could not resolve priority id; provide a valid priority_id or priority_name")
 
-	params = {"priority_id": priority_id}
-	try:
-		return client.ticket.update(id=ticket_id, params=params)
-	except TypeError:
-		return client.ticket.update(ticket_id, params)
+	return _update_ticket(client, ticket_id, {"priority_id": priority_id})
 
 
+@cached(ttl=TICKET_TTL)
 def list_article_attachments(ticket_id: int, article_id: int) -> List[Dict[str, Any]]:
 	"""Return a list of attachment dicts with at least `id` and `filename` when possible.
 
 	Tries multiple ways to discover attachments because different Zammad setups expose
 	attachment metadata differently.
 	"""
-	client = init_zammad_client()
+	client = _get_client()
 
-	# First try the article object itself
-	try:
-		art = client.ticket_article.find(ticket_id=ticket_id, id=article_id)
-		if art:
-			# art may contain an `attachments` list
-			att = art.get("attachments") if isinstance(art, dict) else None
-			if att:
-				return att
-	except Exception:
-		pass
-
-	# Try listing via ticket_article_attachment endpoint if available
-	attachments = []
-	try:
-		if hasattr(client, "ticket_article_attachment"):
-			page = None
+	# First try the article object itself, if the wrapper supports a ticket-scoped find
+	find = client.ticket_article.find
+	if _accepts(find, "ticket_id"):
+		try:
+			art = find(ticket_id=ticket_id, id=article_id)
+			if art:
+				# art may contain an `attachments` list
+				att = art.get("attachments") if isinstance(art, dict) else None
+				if att:
+					return att
+		except _api_errors() as e:
+			logger.debug("Ticket-scoped find of article %s failed: %s", article_id, e)
+
+	# Try listing via ticket_article_attachment endpoint if the wrapper scopes it by ticket
+	# (zammad_py's generic ``all(page, filters)`` has no such listing)
+	if hasattr(client, "ticket_article_attachment"):
+		list_all = client.ticket_article_attachment.all
+		if _accepts(list_all, "ticket_id"):
 			try:
-				page = client.ticket_article_attachment.all(ticket_id=ticket_id, article_id=article_id)
-			except TypeError:
-				# some clients use positional args
-				try:
-					page = client.ticket_article_attachment.all(ticket_id, article_id)
-				except Exception:
-					page = None
-
-			if page:
-				attachments = _collect_pages(page)
-				return attachments
-	except Exception:
-		pass
+				page = list_all(ticket_id=ticket_id, article_id=article_id)
+				if page:
+					return list(_iter_pages(page))
+			except _api_errors() as e:
+				logger.debug("Listing attachments of article %s failed: %s", article_id, e)
 
 	# As a last resort, try to fetch the article by its id and inspect its fields
 	try:
@@ -248,76 +376,72 @@ def list_article_attachments(ticket_id: int, article_id: int) -> List[Dict[str,
 							else:
 								out.append({"id": v, "filename": f"attachment_{v}"})
 						return out
-	except Exception:
-		pass
+	except _api_errors() as e:
+		logger.debug("Fetching article %s failed: %s", article_id, e)
 
 	return []
 
 def download_attachment(attachment_id: int, ticket_id: int, article_id: int, dest_path: str) -> Path:
 	"""Download an attachment to `dest_path`.
 
-	A Zammad client is created internally for this call. `dest_path` should be
+	The shared Zammad client is used for this call. `dest_path` should be
 	a string (helps with ADK automatic function calling); it will be converted
 	to a `Path` internally.
 	"""
-	client = init_zammad_client()
+	client = _get_client()
 	# convert string path to Path to preserve existing behavior
 	dest_path = Path(dest_path)
+	dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-	# Try a few different download call patterns depending on client implementation
-	last_error = None
-	resp = None
-	callers = []
-	if hasattr(client, "ticket_article_attachment"):
-		callers.append(lambda: client.ticket_article_attachment.download(id=attachment_id, ticket_id=ticket_id, article_id=article_id))
-		callers.append(lambda: client.ticket_article_attachment.download(attachment_id, ticket_id, article_id))
-	if hasattr(client, "attachment"):
-		callers.append(lambda: client.attachment.download(id=attachment_id))
-		callers.append(lambda: client.attachment.download(attachment_id))
-
-	# Generic fallback: try top-level download methods
-	callers.append(lambda: getattr(client, "download", lambda *a, **k: None)())
-
-	for c in callers:
+	# Preferred: stream the raw attachment endpoint straight to disk
+	session = getattr(client, "session", None)
+	if session is not None:
+		url = f"{client.url}ticket_attachment/{ticket_id}/{article_id}/{attachment_id}"
 		try:
-			resp = c()
-			if resp:
-				break
-		except Exception as e:
-			last_error = e
-
+			with session.get(url, stream=True) as r:
+				r.raise_for_status()
+				with partial_file(dest_path) as f:
+					for chunk in r.iter_content(DOWNLOAD_CHUNK_SIZE):
+						f.write(chunk)
+			return dest_path
+		except _api_errors() as e:
+			logger.debug("Streaming attachment %s failed, using the wrapper's download: %s", attachment_id, e)
+
+	# Fallback: the wrapper's own download call, resolved once per client
+	if _download_attachment_fn is None:
+		raise RuntimeError("The Zammad client wrapper exposes no attachment download method")
+	resp = _download_attachment_fn(attachment_id, ticket_id, article_id)
 	if not resp:
-		raise RuntimeError(f"No download method returned data. Last error: {last_error}")
+		raise RuntimeError(f"Downloading attachment {attachment_id} returned no data")
+
+	# Extract bytes from response, most common shapes first
+	if hasattr(resp, "read"):
+		with partial_file(dest_path) as f:
+			shutil.copyfileobj(resp, f, DOWNLOAD_CHUNK_SIZE)
+		return dest_path
 
-	# Extract bytes from response
 	if isinstance(resp, (bytes, bytearray)):
-		data = bytes(resp)
+		data = resp
 	elif isinstance(resp, dict):
 		# Some clients return {"data": "base64...", "filename": "..."}
-		if "data" in resp:
-			try:
-				data = base64.b64decode(resp["data"])
-			except Exception:
-				data = json.dumps(resp).encode()
-		elif "file" in resp and isinstance(resp["file"], (bytes, bytearray)):
-			data = bytes(resp["file"])
+		payload = resp.get("data", resp.get("file"))
+		if isinstance(payload, (bytes, bytearray)):
+			data = payload
+		elif isinstance(payload, str) and _BASE64_RE.match(payload):
+			import base64
+			data = base64.b64decode(payload)
 		else:
-			data = json.dumps(resp).encode()
-	elif hasattr(resp, "read"):
-		data = resp.read()
+			raise TypeError(f"Unsupported attachment payload in response keys: {sorted(resp)}")
 	else:
-		try:
-			data = json.dumps(resp).encode()
-		except Exception:
-			data = b""
+		raise TypeError(f"Unsupported attachment response type: {type(resp).__name__}")
 
-	dest_path.parent.mkdir(parents=True, exist_ok=True)
-	with open(dest_path, "wb") as f:
+	with partial_file(dest_path) as f:
 		f.write(data)
 
 	return dest_path
 
 
+@invalidates
 def send_message_to_ticket(ticket_id: int,
 						 message: str,
 						 subject: Optional[str] = None,
@@ -327,9 +451,8 @@ def send_message_to_ticket(ticket_id: int,
 						 additional_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
 	"""Add a message (article) to an existing ticket.
 
-	This helper tries multiple client call patterns to be tolerant of different
-	Zammad client wrapper implementations. It returns the response from the
-	client when a call succeeds.
+	The article is created through whichever endpoint the installed Zammad
+	client wrapper supports, detected once when the shared client is built.
 
 	Parameters:
 	- `ticket_id`: ID of the ticket to add the message to.
@@ -342,7 +465,7 @@ def send_message_to_ticket(ticket_id: int,
 
 	Returns the raw client response (often a dict) on success.
 	"""
-	client = init_zammad_client()
+	_get_client()  # binds _create_article_fn on first use
 	params: Dict[str, Any] = {"ticket_id": ticket_id, "body": message, "internal": internal}
 	if subject is not None:
 		params["subject"] = subject
@@ -353,29 +476,4 @@ def send_message_to_ticket(ticket_id: int,
 	if additional_params:
 		params.update(additional_params)
 
-	last_error = None
-	# Try several common call signatures to support different client wrappers
-	callers = []
-	if hasattr(client, "ticket_article"):
-		callers.append(lambda: client.ticket_article.create(params=params))
-		callers.append(lambda: client.ticket_article.create(params))
-		callers.append(lambda: client.ticket_article.create(ticket_id, params))
-		callers.append(lambda: client.ticket_article.create(**params))
-
-	# Some wrappers provide creation via the ticket endpoint
-	callers.append(lambda: getattr(client, "ticket", None) and client.ticket.update(id=ticket_id, params={"article": params}))
-	callers.append(lambda: getattr(client, "ticket", None) and client.ticket.update(ticket_id, {"article": params}))
-
-	for c in callers:
-		try:
-			resp = c()
-			if resp:
-				return resp
-		except TypeError as te:
-			last_error = te
-			continue
-		except Exception as e:
-			last_error = e
-			continue
-
-	raise RuntimeError(f"Could not create ticket article. Last error: {last_error}")
\ No newline at end of file
+	return _create_article_fn(ticket_id, params)
@@ -0,0 +1,65 @@
+"""Pieces shared by the sync (``zammad_client``) and async (``zammad_async``) helpers.
+
+- ``CONFIG``: the Zammad connection settings, read from the environment once.
+- ``json_loads`` / ``json_dumps``: orjson when installed, else the stdlib.
+- ``partial_file``: the ``.part`` writer every attachment download goes through.
+"""
+
+import contextlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+	import orjson
+
+	json_loads = orjson.loads
+	json_dumps = orjson.dumps
+except ImportError:
+	import json
+
+	json_loads = json.loads
+
+	def json_dumps(obj: Any) -> bytes:
+		return json.dumps(obj).encode()
+
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+
+@dataclass(frozen=True)
+class ZammadConfig:
+	"""Zammad connection settings, read from the environment once at import."""
+	url: str
+	username: str
+	password: str
+
+	@property
+	def api_url(self) -> str:
+		return self.url.rstrip("/") + "/api/v1/"
+
+	@classmethod
+	def from_env(cls) -> "ZammadConfig":
+		values = {name: os.getenv(f"zammad_{name}") for name in ("url", "username", "password")}
+		missing = [f"zammad_{name}" for name, value in values.items() if not value]
+		if missing:
+			raise EnvironmentError(f"Environment variable(s) {', '.join(f'`{m}`' for m in missing)} not set")
+		return cls(**values)
+
+CONFIG = ZammadConfig.from_env()
+
+@contextlib.contextmanager
+def partial_file(dest_path: Path) -> Iterator[Any]:
+	"""Write to a sibling ``.part`` file that replaces `dest_path` only once complete.
+
+	A download that fails midway removes its partial file instead of leaving a
+	truncated one at `dest_path`.
+	"""
+	part = dest_path.with_name(dest_path.name + ".part")
+	try:
+		with open(part, "wb", buffering=DOWNLOAD_BUFFER_SIZE) as f:
+			yield f
+		part.replace(dest_path)
+	except BaseException:
+		part.unlink(missing_ok=True)
+		raise